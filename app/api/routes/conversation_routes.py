@@ -1,4 +1,7 @@
+from typing import Optional
+from uuid import UUID
 from fastapi import APIRouter, Depends, Query, Path
+from fastapi.responses import Response
 
 from app.controllers.conversation_controller import ConversationController
 from app.schemas.conversation import (
@@ -8,27 +11,27 @@ from app.schemas.conversation import (
 
 router = APIRouter(prefix="/api/conversations", tags=["Conversations"])
 
-@router.get("/user/{user_id}", response_model=PaginatedConversationResponse)
+@router.get("/user/{user_id}", responses={200: {"model": PaginatedConversationResponse}})
 async def get_user_conversations(
     user_id: int = Path(..., description="ID of the user"),
-    page: int = Query(1, description="Page number"),
-    limit: int = Query(20, description="Number of conversations per page"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Number of conversations per page"),
     conversation_controller: ConversationController = Depends()
-) -> PaginatedConversationResponse:
+) -> Response:
     """
     Get all conversations for a user with pagination
     """
     return await conversation_controller.get_user_conversations(
         user_id=user_id,
-        page=page,
+        cursor=cursor,
         limit=limit
     )
 
-@router.get("/{conversation_id}", response_model=ConversationResponse)
+@router.get("/{conversation_id}", responses={200: {"model": ConversationResponse}})
 async def get_conversation(
-    conversation_id: int = Path(..., description="ID of the conversation"),
+    conversation_id: UUID = Path(..., description="ID of the conversation"),
     conversation_controller: ConversationController = Depends()
-) -> ConversationResponse:
+) -> Response:
     """
     Get a specific conversation by ID
     """
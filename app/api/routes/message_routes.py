@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi.responses import ORJSONResponse
 from typing import Optional
+from uuid import UUID
 from datetime import datetime
 
 from app.controllers.message_controller import MessageController
@@ -11,46 +13,46 @@ from app.schemas.message import (
 
 router = APIRouter(prefix="/api/messages", tags=["Messages"])
 
-@router.post("/", response_model=MessageResponse, status_code=201)
+@router.post("/", status_code=201, responses={201: {"model": MessageResponse}})
 async def send_message(
     message: MessageCreate = Body(...),
     message_controller: MessageController = Depends()
-) -> MessageResponse:
+) -> ORJSONResponse:
     """
     Send a message from one user to another
     """
     return await message_controller.send_message(message)
 
-@router.get("/conversation/{conversation_id}", response_model=PaginatedMessageResponse)
+@router.get("/conversation/{conversation_id}", responses={200: {"model": PaginatedMessageResponse}})
 async def get_conversation_messages(
-    conversation_id: int = Path(..., description="ID of the conversation"),
-    page: int = Query(1, description="Page number"),
-    limit: int = Query(20, description="Number of messages per page"),
+    conversation_id: UUID = Path(..., description="ID of the conversation"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    limit: int = Query(20, ge=1, le=100, description="Number of messages per page"),
     message_controller: MessageController = Depends()
-) -> PaginatedMessageResponse:
+) -> ORJSONResponse:
     """
     Get all messages in a conversation with pagination
     """
     return await message_controller.get_conversation_messages(
         conversation_id=conversation_id,
-        page=page,
+        cursor=cursor,
         limit=limit
     )
 
-@router.get("/conversation/{conversation_id}/before", response_model=PaginatedMessageResponse)
+@router.get("/conversation/{conversation_id}/before", responses={200: {"model": PaginatedMessageResponse}})
 async def get_messages_before_timestamp(
-    conversation_id: int = Path(..., description="ID of the conversation"),
+    conversation_id: UUID = Path(..., description="ID of the conversation"),
     before_timestamp: datetime = Query(..., description="Get messages before this timestamp"),
-    page: int = Query(1, description="Page number"),
-    limit: int = Query(20, description="Number of messages per page"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page (takes precedence over before_timestamp)"),
+    limit: int = Query(20, ge=1, le=100, description="Number of messages per page"),
     message_controller: MessageController = Depends()
-) -> PaginatedMessageResponse:
+) -> ORJSONResponse:
     """
     Get messages in a conversation before a specific timestamp with pagination
     """
     return await message_controller.get_messages_before_timestamp(
         conversation_id=conversation_id,
         before_timestamp=before_timestamp,
-        page=page,
+        cursor=cursor,
         limit=limit
     )
\ No newline at end of file
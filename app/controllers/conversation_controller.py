@@ -1,8 +1,21 @@
+from typing import Optional
+from uuid import UUID
+import orjson
 from fastapi import HTTPException, status
+from fastapi.responses import Response
 from datetime import datetime
 
-from app.schemas.conversation import ConversationResponse, PaginatedConversationResponse
-from app.models.cassandra_models import ConversationModel
+from app.controllers.pagination import encode_cursor, decode_cursor, invalid_cursor
+from app.db.redis_client import redis_client, conversation_key, user_conversations_key
+from app.models.cassandra_models import ConversationModel, InvalidPagingStateError
+
+# Cache lifetimes in seconds, which bound how stale a cached response can
+# be. Conversation lists go stale on every new message. A conversation is
+# invalidated when a message is sent, but a read racing that send (or an
+# invalidation skipped while Redis is unreachable) can still cache the old
+# last message, so it gets the same short lifetime.
+CONVERSATION_CACHE_TTL = 30
+USER_CONVERSATIONS_CACHE_TTL = 30
 
 class ConversationController:
     """
@@ -12,48 +25,51 @@ class ConversationController:
     async def get_user_conversations(
             self,
             user_id: int,
-            page: int = 1,
+            cursor: Optional[str] = None,
             limit: int = 20
-    ) -> PaginatedConversationResponse:
+    ) -> Response:
         """
         Get all conversations for a user with pagination
 
         Args:
             user_id: ID of the user
-            page: Page number
+            cursor: Cursor returned as `next_cursor` by the previous page
             limit: Number of conversations per page
 
         Returns:
             Paginated list of conversations
 
         Raises:
-            HTTPException: If user not found or access denied
+            HTTPException: If the cursor is invalid, or user not found or access denied
         """
+        paging_state = decode_cursor(cursor)
+        cache_key = user_conversations_key(user_id, cursor, limit)
+
         try:
-            result = await ConversationModel.get_user_conversations(user_id, page, limit)
-
-            return PaginatedConversationResponse(
-                total=result['total'],
-                page=result['page'],
-                limit=result['limit'],
-                data=[
-                    ConversationResponse(
-                        id=str(conv['id']),
-                        user1_id=conv['user1_id'],
-                        user2_id=conv['user2_id'],
-                        last_message_at=conv['last_message_at'],
-                        last_message_content=conv['last_message_content']
-                    )
-                    for conv in result['data']
-                ]
-            )
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
+            result = await ConversationModel.get_user_conversations(user_id, paging_state, limit)
+
+            body = orjson.dumps({
+                "limit": result['limit'],
+                "next_cursor": encode_cursor(result['paging_state']),
+                "has_more": result['paging_state'] is not None,
+                "data": result['data']
+            })
+            await redis_client.set(cache_key, body, USER_CONVERSATIONS_CACHE_TTL)
+
+            return Response(content=body, media_type="application/json")
+        except InvalidPagingStateError:
+            raise invalid_cursor()
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to get user conversations: {str(e)}"
             )
 
-    async def get_conversation(self, conversation_id: int) -> ConversationResponse:
+    async def get_conversation(self, conversation_id: UUID) -> Response:
         """
         Get a specific conversation by ID
 
@@ -66,7 +82,15 @@ class ConversationController:
         Raises:
             HTTPException: If conversation not found or access denied
         """
+        cache_key = conversation_key(conversation_id)
+
         try:
+            # Cached entries are stored already serialized, so a hit is
+            # returned as-is without decoding
+            cached = await redis_client.get(cache_key)
+            if cached is not None:
+                return Response(content=cached, media_type="application/json")
+
             conversation = await ConversationModel.get_conversation(conversation_id)
 
             if not conversation:
@@ -75,13 +99,10 @@ class ConversationController:
                     detail=f"Conversation with ID {conversation_id} not found"
                 )
 
-            return ConversationResponse(
-                id=str(conversation['id']),
-                user1_id=conversation['user1_id'],
-                user2_id=conversation['user2_id'],
-                last_message_at=conversation['last_message_at'],
-                last_message_content=conversation['last_message_content']
-            )
+            body = orjson.dumps(conversation)
+            await redis_client.set(cache_key, body, CONVERSATION_CACHE_TTL)
+
+            return Response(content=body, media_type="application/json")
         except HTTPException:
             raise
         except Exception as e:
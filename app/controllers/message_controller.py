@@ -1,9 +1,12 @@
 from typing import Optional
+from uuid import UUID
 from datetime import datetime
 from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse
 
-from app.schemas.message import MessageCreate, MessageResponse, PaginatedMessageResponse
-from app.models.cassandra_models import MessageModel
+from app.controllers.pagination import encode_cursor, decode_cursor, invalid_cursor
+from app.schemas.message import MessageCreate
+from app.models.cassandra_models import MessageModel, ConversationNotFoundError, InvalidPagingStateError
 
 
 class MessageController:
@@ -11,7 +14,7 @@ class MessageController:
     Controller for handling message operations
     """
 
-    async def send_message(self, message_data: MessageCreate) -> MessageResponse:
+    async def send_message(self, message_data: MessageCreate) -> ORJSONResponse:
         """
         Send a message from one user to another
 
@@ -25,22 +28,13 @@ class MessageController:
             HTTPException: If message sending fails
         """
         try:
-            from app.models.cassandra_models import MessageModel
-
             result = await MessageModel.create_message(
                 sender_id=message_data.sender_id,
                 receiver_id=message_data.receiver_id,
                 content=message_data.content
             )
 
-            return MessageResponse(
-                id=result['id'],
-                sender_id=result['sender_id'],
-                receiver_id=result['receiver_id'],
-                content=result['content'],
-                created_at=result['created_at'],
-                conversation_id=result['conversation_id']
-            )
+            return ORJSONResponse(content=result, status_code=status.HTTP_201_CREATED)
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -49,45 +43,39 @@ class MessageController:
 
     async def get_conversation_messages(
             self,
-            conversation_id: int,
-            page: int = 1,
+            conversation_id: UUID,
+            cursor: Optional[str] = None,
             limit: int = 20
-    ) -> PaginatedMessageResponse:
+    ) -> ORJSONResponse:
         """
         Get all messages in a conversation with pagination
 
         Args:
             conversation_id: ID of the conversation
-            page: Page number
+            cursor: Cursor returned as `next_cursor` by the previous page
             limit: Number of messages per page
 
         Returns:
             Paginated list of messages
 
         Raises:
-            HTTPException: If conversation not found or access denied
+            HTTPException: If the cursor is invalid, or conversation not found or access denied
         """
+        paging_state = decode_cursor(cursor)
+
         try:
-            from app.models.cassandra_models import MessageModel
-
-            result = await MessageModel.get_conversation_messages(conversation_id, page, limit)
-
-            return PaginatedMessageResponse(
-                total=result['total'],
-                page=result['page'],
-                limit=result['limit'],
-                data=[
-                    MessageResponse(
-                        id=msg['id'],
-                        sender_id=msg['sender_id'],
-                        receiver_id=msg['receiver_id'],
-                        content=msg['content'],
-                        created_at=msg['created_at'],
-                        conversation_id=msg['conversation_id']
-                    )
-                    for msg in result['data']
-                ]
-            )
+            result = await MessageModel.get_conversation_messages(conversation_id, paging_state, limit)
+
+            return ORJSONResponse(content={
+                "limit": result['limit'],
+                "next_cursor": encode_cursor(result['paging_state']),
+                "has_more": result['paging_state'] is not None,
+                "data": result['data']
+            })
+        except ConversationNotFoundError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except InvalidPagingStateError:
+            raise invalid_cursor()
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -96,49 +84,43 @@ class MessageController:
 
     async def get_messages_before_timestamp(
             self,
-            conversation_id: int,
+            conversation_id: UUID,
             before_timestamp: datetime,
-            page: int = 1,
+            cursor: Optional[str] = None,
             limit: int = 20
-    ) -> PaginatedMessageResponse:
+    ) -> ORJSONResponse:
         """
         Get messages in a conversation before a specific timestamp with pagination
 
         Args:
             conversation_id: ID of the conversation
             before_timestamp: Get messages before this timestamp
-            page: Page number
+            cursor: Cursor returned as `next_cursor` by the previous page
             limit: Number of messages per page
 
         Returns:
             Paginated list of messages
 
         Raises:
-            HTTPException: If conversation not found or access denied
+            HTTPException: If the cursor is invalid, or conversation not found or access denied
         """
-        try:
-            from app.models.cassandra_models import MessageModel
+        paging_state = decode_cursor(cursor)
 
+        try:
             result = await MessageModel.get_messages_before_timestamp(
-                conversation_id, before_timestamp, page, limit
+                conversation_id, before_timestamp, paging_state, limit
             )
 
-            return PaginatedMessageResponse(
-                total=result['total'],
-                page=result['page'],
-                limit=result['limit'],
-                data=[
-                    MessageResponse(
-                        id=msg['id'],
-                        sender_id=msg['sender_id'],
-                        receiver_id=msg['receiver_id'],
-                        content=msg['content'],
-                        created_at=msg['created_at'],
-                        conversation_id=msg['conversation_id']
-                    )
-                    for msg in result['data']
-                ]
-            )
+            return ORJSONResponse(content={
+                "limit": result['limit'],
+                "next_cursor": encode_cursor(result['paging_state']),
+                "has_more": result['paging_state'] is not None,
+                "data": result['data']
+            })
+        except ConversationNotFoundError as e:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        except InvalidPagingStateError:
+            raise invalid_cursor()
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
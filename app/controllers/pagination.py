@@ -0,0 +1,52 @@
+"""
+Helpers for the opaque cursors used by paginated endpoints.
+"""
+import base64
+import binascii
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+
+def invalid_cursor() -> HTTPException:
+    """The error returned for a cursor that can't be decoded or resumed."""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid pagination cursor"
+    )
+
+
+def encode_cursor(paging_state: Optional[bytes]) -> Optional[str]:
+    """
+    Encode a Cassandra paging state as a URL-safe cursor.
+
+    Args:
+        paging_state: Paging state returned by the driver
+
+    Returns:
+        The cursor string, or None when there are no further pages
+    """
+    if not paging_state:
+        return None
+    return base64.urlsafe_b64encode(paging_state).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[bytes]:
+    """
+    Decode a cursor received from the client back into a paging state.
+
+    Args:
+        cursor: Cursor previously returned as `next_cursor`
+
+    Returns:
+        The paging state, or None to fetch the first page
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        return base64.b64decode(cursor.encode("ascii"), altchars=b"-_", validate=True)
+    except (binascii.Error, ValueError):
+        raise invalid_cursor()
@@ -1,15 +1,25 @@
 import os
 import uuid
+import asyncio
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from datetime import datetime
 import logging
-from cassandra.cluster import Cluster, Session, NoHostAvailable
+from cassandra.cluster import Cluster, Session, ResponseFuture, ResultSet, NoHostAvailable
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.query import SimpleStatement, dict_factory
+from cassandra import ConsistencyLevel
+from cassandra.query import PreparedStatement, BatchStatement, BatchType, named_tuple_factory
 
 logger = logging.getLogger(__name__)
 
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    if not future.done():
+        future.set_result(result)
+
+def _set_exception(future: asyncio.Future, exc: BaseException) -> None:
+    if not future.done():
+        future.set_exception(exc)
+
 class CassandraClient:
     """Singleton Cassandra client for the application."""
    
@@ -29,105 +39,213 @@ class CassandraClient:
         self.host = os.getenv("CASSANDRA_HOST", "localhost")
         self.port = int(os.getenv("CASSANDRA_PORT", "9042"))
         self.keyspace = os.getenv("CASSANDRA_KEYSPACE", "messenger")
+        self._keyspace_create_cql = f"""
+            CREATE KEYSPACE IF NOT EXISTS {self.keyspace}
+            WITH REPLICATION = {{'class': 'SimpleStrategy', 'replication_factor': 3}}
+        """
        
         self.cluster = None
         self.session = None
+        self._prepared: Dict[str, PreparedStatement] = {}
         
         self._initialized = True
    
     def connect(self) -> None:
-        """Connect to the Cassandra cluster with retry logic."""
+        """
+        Connect to the Cassandra cluster with retry logic.
+
+        Called once at application startup; the execute methods assume an
+        open session and do not connect lazily.
+        """
         max_retries = 10
         retry_delay = 5
         
         for attempt in range(max_retries):
             try:
-                logger.info(f"Connecting to Cassandra at {self.host}:{self.port} (attempt {attempt+1}/{max_retries})...")
-                self.cluster = Cluster([self.host])
+                logger.info("Connecting to Cassandra at %s:%s (attempt %s/%s)...", self.host, self.port, attempt+1, max_retries)
+                # The default libev reactor is kept: its I/O thread resolves
+                # ResponseFutures and _wait hands results back to the event
+                # loop, so request handlers never block on Cassandra.
+                self.cluster = Cluster(
+                    contact_points=[self.host],
+                    port=self.port,
+                    protocol_version=5,
+                    executor_threads=8
+                )
                 
                 temp_session = self.cluster.connect()
                 
                 self._ensure_keyspace_exists(temp_session)
                 
                 self.session = self.cluster.connect(self.keyspace)
-                self.session.row_factory = dict_factory
+                self.session.row_factory = named_tuple_factory
+                # Small default pages for ad-hoc queries; paged reads set their own fetch_size
+                self.session.default_fetch_size = 50
+                self.session.default_timeout = 10
+                self._prepared.clear()
                 
-                logger.info(f"Successfully connected to Cassandra at {self.host}:{self.port}, keyspace: {self.keyspace}")
+                logger.info("Successfully connected to Cassandra at %s:%s, keyspace: %s", self.host, self.port, self.keyspace)
                 return
             except Exception as e:
                 if attempt < max_retries - 1:
-                    logger.warning(f"Failed to connect to Cassandra (attempt {attempt+1}): {str(e)}")
-                    logger.info(f"Retrying in {retry_delay} seconds...")
+                    logger.warning("Failed to connect to Cassandra (attempt %s): %s", attempt+1, e)
+                    logger.info("Retrying in %s seconds...", retry_delay)
                     time.sleep(retry_delay)
                     retry_delay = min(retry_delay * 1.5, 30)
                 else:
-                    logger.error(f"Failed to connect to Cassandra after {max_retries} attempts: {str(e)}")
+                    logger.error("Failed to connect to Cassandra after %s attempts: %s", max_retries, e)
                     raise
     
     def _ensure_keyspace_exists(self, session):
         """Ensure the keyspace exists, create it if it doesn't."""
         try:
-            rows = session.execute(f"SELECT keyspace_name FROM system_schema.keyspaces WHERE keyspace_name = '{self.keyspace}'")
+            lookup = session.prepare("SELECT keyspace_name FROM system_schema.keyspaces WHERE keyspace_name = ?")
+            rows = session.execute(lookup, (self.keyspace,))
             if not rows:
-                logger.info(f"Creating keyspace {self.keyspace}...")
-                session.execute(f"""
-                    CREATE KEYSPACE IF NOT EXISTS {self.keyspace}
-                    WITH REPLICATION = {{'class': 'SimpleStrategy', 'replication_factor': 3}}
-                """)
-                logger.info(f"Keyspace {self.keyspace} created successfully")
+                logger.info("Creating keyspace %s...", self.keyspace)
+                session.execute(self._keyspace_create_cql)
+                logger.info("Keyspace %s created successfully", self.keyspace)
         except Exception as e:
-            logger.error(f"Error ensuring keyspace exists: {str(e)}")
+            logger.error("Error ensuring keyspace exists: %s", e)
             raise
    
     def close(self) -> None:
         """Close the Cassandra connection."""
         if self.cluster:
             self.cluster.shutdown()
+            self._prepared.clear()
             logger.info("Cassandra connection closed")
+
+    def _prepare(self, query: str) -> PreparedStatement:
+        """Return the prepared statement for a query, preparing it on first use."""
+        prepared = self._prepared.get(query)
+        if prepared is None:
+            prepared = self.session.prepare(query)
+            self._prepared[query] = prepared
+        return prepared
    
-    def execute(self, query: str, params: dict = None) -> List[Dict[str, Any]]:
+    def execute(self, query: str, params: Sequence[Any] = ()) -> List[tuple]:
         """
-        Execute a CQL query.
+        Execute a CQL query as a cached prepared statement.
        
         Args:
-            query: The CQL query string
-            params: The parameters for the query
+            query: The CQL query string using `?` placeholders
+            params: The positional parameters for the query
            
         Returns:
-            List of rows as dictionaries
+            List of rows as named tuples
         """
-        if not self.session:
-            self.connect()
-       
         try:
-            statement = SimpleStatement(query)
-            result = self.session.execute(statement, params or {})
+            result = self.session.execute(self._prepare(query), params)
             return list(result)
         except Exception as e:
-            logger.error(f"Query execution failed: {str(e)}")
+            logger.error("Query execution failed: %s", e)
             raise
    
-    def execute_async(self, query: str, params: dict = None):
+    def execute_async(self, query: str, params: Sequence[Any] = ()) -> ResponseFuture:
         """
-        Execute a CQL query asynchronously.
+        Execute a CQL query as a cached prepared statement asynchronously.
        
         Args:
-            query: The CQL query string
-            params: The parameters for the query
+            query: The CQL query string using `?` placeholders
+            params: The positional parameters for the query
            
         Returns:
-            Async result object
+            The driver ResponseFuture (use execute_future to await it)
         """
-        if not self.session:
-            self.connect()
+        try:
+            return self.session.execute_async(self._prepare(query), params)
+        except Exception as e:
+            logger.error("Async query execution failed: %s", e)
+            raise
+   
+    async def execute_future(self, query: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """
+        Execute a CQL query as a cached prepared statement without blocking the event loop.
        
+        Args:
+            query: The CQL query string using `?` placeholders
+            params: The positional parameters for the query
+           
+        Returns:
+            List of rows as named tuples (first page of the result)
+        """
         try:
-            statement = SimpleStatement(query)
-            return self.session.execute_async(statement, params or {})
+            result = await self._wait(self.session.execute_async(self._prepare(query), params))
+            return result.current_rows
         except Exception as e:
-            logger.error(f"Async query execution failed: {str(e)}")
+            logger.error("Async query execution failed: %s", e)
             raise
    
+    async def execute_paged(
+            self,
+            query: str,
+            params: Sequence[Any],
+            fetch_size: int,
+            paging_state: Optional[bytes] = None
+    ) -> Tuple[List[tuple], Optional[bytes]]:
+        """
+        Fetch a single page of a prepared CQL query using the driver's native paging.
+       
+        Args:
+            query: The CQL query string using `?` placeholders
+            params: The positional parameters for the query
+            fetch_size: Number of rows in the page
+            paging_state: Paging state returned for the previous page, if any
+           
+        Returns:
+            Tuple of the page rows and the paging state of the next page
+            (None when there are no further pages)
+        """
+        try:
+            statement = self._prepare(query).bind(params)
+            statement.fetch_size = fetch_size
+            result = await self._wait(self.session.execute_async(statement, paging_state=paging_state))
+            return result.current_rows, result.paging_state
+        except Exception as e:
+            logger.error("Paged query execution failed: %s", e)
+            raise
+   
+    async def execute_batch(
+            self,
+            statements: Sequence[Tuple[str, Sequence[Any]]],
+            consistency_level: int = ConsistencyLevel.ONE,
+            batch_type: BatchType = BatchType.UNLOGGED
+    ) -> None:
+        """
+        Execute several prepared CQL statements as one batch.
+
+        UNLOGGED batches should only group statements that target the same
+        partition key; batches spanning partitions put extra load on the
+        coordinator. Use a LOGGED batch only when writes to different
+        partitions must all be applied together.
+       
+        Args:
+            statements: Sequence of (query, positional parameters) pairs
+            consistency_level: Consistency level for the batch
+            batch_type: UNLOGGED (default) or LOGGED for atomic multi-partition writes
+        """
+        try:
+            batch = BatchStatement(batch_type=batch_type, consistency_level=consistency_level)
+            for query, params in statements:
+                batch.add(self._prepare(query), params)
+            await self._wait(self.session.execute_async(batch))
+        except Exception as e:
+            logger.error("Batch execution failed: %s", e)
+            raise
+   
+    @staticmethod
+    async def _wait(response_future: ResponseFuture) -> ResultSet:
+        """Await a driver ResponseFuture, resolving it on the running event loop."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        response_future.add_callbacks(
+            lambda _rows: loop.call_soon_threadsafe(_set_result, future, None),
+            lambda exc: loop.call_soon_threadsafe(_set_exception, future, exc)
+        )
+        await future
+        return response_future.result()
+   
     def get_session(self) -> Session:
         """Get the Cassandra session."""
         if not self.session:
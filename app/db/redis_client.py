@@ -0,0 +1,143 @@
+import os
+import time
+import logging
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+def conversation_key(conversation_id) -> str:
+    """Cache key for a single conversation."""
+    return f"conv:{conversation_id}"
+
+def user_conversations_key(user_id: int, cursor: Optional[str], limit: int) -> str:
+    """Cache key for one page of a user's conversations."""
+    return f"user_convs:{user_id}:{cursor or ''}:{limit}"
+
+# After a connection failure Redis is skipped for this many seconds, doubling
+# on each further failure up to the maximum, so an outage costs one timeout
+# per backoff period rather than one per request
+UNAVAILABLE_BACKOFF = 1.0
+MAX_UNAVAILABLE_BACKOFF = 30.0
+
+class RedisClient:
+    """Singleton Redis client used as a read-through cache for the application."""
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(RedisClient, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the Redis configuration."""
+        if getattr(self, '_initialized', False):
+            return
+
+        self.url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.client: Optional[Redis] = None
+        self._unavailable_until = 0.0
+        self._backoff = UNAVAILABLE_BACKOFF
+
+        self._initialized = True
+
+    def connect(self) -> None:
+        """Create the Redis connection pool (connections are opened lazily)."""
+        self.client = Redis.from_url(
+            self.url,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+        logger.info("Redis cache configured at %s", self.url)
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+            logger.info("Redis connection closed")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached bytes, or None on a miss or if Redis is unavailable
+        """
+        if not self._available():
+            return None
+
+        try:
+            value = await self.client.get(key)
+        except RedisError as e:
+            self._failed("GET", key, e)
+            return None
+        self._succeeded()
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Cache a value with an expiry.
+
+        Args:
+            key: The cache key
+            value: The bytes to cache
+            ttl: Time to live in seconds
+        """
+        if not self._available():
+            return
+
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except RedisError as e:
+            self._failed("SET", key, e)
+            return
+        self._succeeded()
+
+    async def delete(self, key: str) -> None:
+        """
+        Invalidate a cached value.
+
+        Args:
+            key: The cache key
+        """
+        if not self._available():
+            return
+
+        try:
+            await self.client.delete(key)
+        except RedisError as e:
+            self._failed("DEL", key, e)
+            return
+        self._succeeded()
+
+    def _available(self) -> bool:
+        """Whether to try Redis now, connecting on first use."""
+        if time.monotonic() < self._unavailable_until:
+            return False
+        if not self.client:
+            self.connect()
+        return True
+
+    def _failed(self, command: str, key: str, error: RedisError) -> None:
+        """Log a failed command, backing off from Redis if it is unreachable."""
+        if not isinstance(error, (ConnectionError, TimeoutError)):
+            logger.warning("Redis %s failed for %s: %s", command, key, error)
+            return
+        logger.warning(
+            "Redis %s failed for %s: %s; skipping Redis for %ss", command, key, error, self._backoff
+        )
+        self._unavailable_until = time.monotonic() + self._backoff
+        self._backoff = min(self._backoff * 2, MAX_UNAVAILABLE_BACKOFF)
+
+    def _succeeded(self) -> None:
+        self._backoff = UNAVAILABLE_BACKOFF
+
+redis_client = RedisClient()
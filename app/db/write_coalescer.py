@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+from app.db.cassandra_client import cassandra_client
+
+logger = logging.getLogger(__name__)
+
+class WriteCoalescer:
+    """
+    Micro-batches writes that target the same Cassandra partition.
+
+    Writes are buffered per partition key and flushed every `flush_interval`
+    seconds (or as soon as a partition has `max_batch_size` pending writes),
+    each partition as one UNLOGGED batch sent from its own task, so a slow
+    partition never holds up the others or the flush timer. Callers await
+    their own write, so a request still only completes once its row is stored.
+    """
+
+    def __init__(self, flush_interval: float = 0.02, max_batch_size: int = 50):
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._buffer: Dict[Hashable, List[Tuple[str, Sequence[Any], asyncio.Future]]] = defaultdict(list)
+        self._task: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info("Write coalescer started (flush every %ss)", self.flush_interval)
+
+    async def stop(self) -> None:
+        """Stop the background flusher and wait for every pending write."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        logger.info("Write coalescer stopped")
+
+    async def write(self, partition_key: Hashable, query: str, params: Sequence[Any]) -> None:
+        """
+        Queue a write and wait until the batch containing it is applied.
+
+        Args:
+            partition_key: Full partition key the statement writes to
+            query: The CQL query string using `?` placeholders
+            params: The positional parameters for the query
+
+        Raises:
+            Exception: If the batch containing the write fails
+        """
+        if self._task is None:
+            # Not running (e.g. outside the app), so write directly
+            await cassandra_client.execute_future(query, params)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        pending = self._buffer[partition_key]
+        pending.append((query, params, future))
+
+        if len(pending) >= self.max_batch_size:
+            self._dispatch(self._buffer.pop(partition_key))
+
+        await future
+
+    async def flush(self) -> None:
+        """Send every buffered partition and wait for all in-flight batches."""
+        self._dispatch_all()
+        while self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _dispatch_all(self) -> None:
+        if not self._buffer:
+            return
+        buffered, self._buffer = self._buffer, defaultdict(list)
+        for pending in buffered.values():
+            self._dispatch(pending)
+
+    def _dispatch(self, pending: List[Tuple[str, Sequence[Any], asyncio.Future]]) -> None:
+        task = asyncio.create_task(self._flush_partition(pending))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self) -> None:
+        # Only sleeps and hands batches to their own tasks, so cancelling it
+        # never interrupts a batch in flight
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self._dispatch_all()
+
+    @staticmethod
+    async def _flush_partition(pending: List[Tuple[str, Sequence[Any], asyncio.Future]]) -> None:
+        try:
+            await cassandra_client.execute_batch([(query, params) for query, params, _ in pending])
+        except asyncio.CancelledError:
+            for _, _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, _, future in pending:
+            if not future.done():
+                future.set_result(None)
+
+write_coalescer = WriteCoalescer()
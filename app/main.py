@@ -1,6 +1,8 @@
 import logging
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import sys
 import os
 import asyncio
@@ -9,6 +11,8 @@ from app.api.routes import message_router, conversation_router
 from app.controllers.message_controller import MessageController
 from app.controllers.conversation_controller import ConversationController
 from app.db.cassandra_client import cassandra_client
+from app.db.redis_client import redis_client
+from app.db.write_coalescer import write_coalescer
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,23 +23,38 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="FB Messenger API",
     description="Backend API for FB Messenger implementation using Cassandra",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[""],
-    allow_credentials=True,
-    allow_methods=[""],
+    # No cookie auth, so credentials are not allowed: with a wildcard origin
+    # that would let any site make credentialed requests
+    allow_origins=["*"],
+    allow_methods=["*"],
     allow_headers=["*"],
+    max_age=600,
 )
+# Compress larger (paginated) JSON responses; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Opt-in request profiling: with PROFILE set, add ?profile=1 to any request
+# to write a pyinstrument flame graph to /tmp/profiles
+if os.getenv("PROFILE"):
+    from app.middleware.profiler import ProfilerMiddleware
+    app.add_middleware(ProfilerMiddleware)
+
+# Controllers are stateless, so a single instance of each is shared by all requests
+_message_controller = MessageController()
+_conversation_controller = ConversationController()
 
 def get_message_controller():
     """Dependency for message controller."""
-    return MessageController()
+    return _message_controller
 
 def get_conversation_controller():
     """Dependency for conversation controller."""
-    return ConversationController()
+    return _conversation_controller
 
 app.dependency_overrides[MessageController] = get_message_controller
 app.dependency_overrides[ConversationController] = get_conversation_controller
@@ -56,24 +75,36 @@ async def startup_event():
 
     for attempt in range(max_retries):
         try:
-            cassandra_client.get_session()
+            cassandra_client.connect()
             logger.info("Cassandra connection established")
+            write_coalescer.start()
             return
         except Exception as e:
             if attempt < max_retries - 1:
-                logger.warning(f"Failed to connect to Cassandra (attempt {attempt+1}): {str(e)}")
-                logger.info(f"Retrying in {retry_delay} seconds...")
+                logger.warning("Failed to connect to Cassandra (attempt %s): %s", attempt+1, e)
+                logger.info("Retrying in %s seconds...", retry_delay)
                 await asyncio.sleep(retry_delay)
             else:
-                logger.error(f"Failed to connect to Cassandra after {max_retries} attempts: {str(e)}")
+                logger.error("Failed to connect to Cassandra after %s attempts: %s", max_retries, e)
                 sys.exit(1)
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("Shutting down application...")
+    await write_coalescer.stop()
+    await redis_client.close()
     cassandra_client.close()
 
-if __name__ == "main":
+if __name__ == "__main__":
+    # Production entry point (`python -m app.main`); use `uvicorn app.main:app --reload` for development
     import uvicorn
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=(os.cpu_count() or 1) * 2,
+        reload=False
+    ) 
\ No newline at end of file
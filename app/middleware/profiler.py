@@ -0,0 +1,38 @@
+import os
+import uuid
+import logging
+
+from pyinstrument import Profiler
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+class ProfilerMiddleware:
+    """
+    ASGI middleware that profiles requests sent with a `profile` query parameter.
+
+    Each profiled request is written as an HTML flame graph to `output_dir`.
+    Only mounted when the PROFILE environment variable is set.
+    """
+
+    def __init__(self, app: ASGIApp, output_dir: str = "/tmp/profiles"):
+        self.app = app
+        self.output_dir = output_dir
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not QueryParams(scope["query_string"]).get("profile"):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            path = os.path.join(self.output_dir, f"{uuid.uuid4()}.html")
+            with open(path, "w") as f:
+                f.write(profiler.output_html())
+            logger.info("Profile for %s %s written to %s", scope["method"], scope["path"], path)
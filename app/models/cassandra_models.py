@@ -1,11 +1,125 @@
 """
 Models for interacting with Cassandra tables.
 """
+import asyncio
+import struct
 import uuid
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from cachetools import LRUCache
+from cassandra import InvalidRequest
+from cassandra.protocol import ProtocolException
+from cassandra.util import uuid_from_time, datetime_from_uuid1, min_uuid_from_time
 
 from app.db.cassandra_client import cassandra_client
+from app.db.redis_client import redis_client, conversation_key
+from app.db.write_coalescer import write_coalescer
+
+# CQL statements, prepared once per session by cassandra_client and bound
+# with positional parameters
+
+INSERT_MSG_CQL = """
+    INSERT INTO messages_by_conversation (
+        conversation_id, bucket, created_at, message_id, sender_id, receiver_id, content
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows holding "the latest message" are written USING TIMESTAMP of the
+# message's created_at, so the newest message wins regardless of which
+# write reaches Cassandra last
+
+UPDATE_META_CQL = """
+    UPDATE conversation_metadata USING TIMESTAMP ?
+    SET last_message_at = ?, last_message_content = ?, user1_id = ?, user2_id = ?
+    WHERE conversation_id = ?
+"""
+
+UPSERT_CONV_LATEST_CQL = """
+    UPDATE conversations_latest_by_user USING TIMESTAMP ?
+    SET last_message_at = ?, other_user_id = ?, last_message_content = ?, user1_id = ?, user2_id = ?
+    WHERE user_id = ? AND conversation_id = ?
+"""
+
+SELECT_MSGS_CQL = """
+    SELECT conversation_id, created_at, message_id, sender_id, receiver_id, content
+    FROM messages_by_conversation
+    WHERE conversation_id = ? AND bucket = ?
+"""
+
+SELECT_MSGS_BEFORE_CQL = """
+    SELECT conversation_id, created_at, message_id, sender_id, receiver_id, content
+    FROM messages_by_conversation
+    WHERE conversation_id = ? AND bucket = ? AND (created_at, message_id) < (?, ?)
+    LIMIT ?
+"""
+
+SELECT_CONVS_BY_USER_CQL = """
+    SELECT conversation_id, user1_id, user2_id, last_message_at, last_message_content
+    FROM conversations_by_user
+    WHERE user_id = ?
+"""
+
+SELECT_META_CQL = """
+    SELECT conversation_id, user1_id, user2_id, created_at, last_message_at, last_message_content
+    FROM conversation_metadata
+    WHERE conversation_id = ?
+"""
+
+SELECT_LAST_MESSAGE_AT_CQL = "SELECT last_message_at FROM conversation_metadata WHERE conversation_id = ?"
+
+LOOKUP_CQL = "SELECT conversation_id FROM user_conversations_lookup WHERE user1_id = ? AND user2_id = ?"
+
+INSERT_META_CQL = """
+    INSERT INTO conversation_metadata (
+        conversation_id, user1_id, user2_id, created_at, last_message_at, last_message_content
+    ) VALUES (?, ?, ?, ?, ?, ?)
+    USING TIMESTAMP ?
+"""
+
+INSERT_LOOKUP_CQL = """
+    INSERT INTO user_conversations_lookup (
+        user1_id, user2_id, conversation_id
+    ) VALUES (?, ?, ?)
+    IF NOT EXISTS
+"""
+
+# Conversation IDs and participants keyed by the sorted (user1_id, user2_id)
+# pair. Only IDs read from or confirmed by user_conversations_lookup are
+# cached, and that mapping never changes once created, so a warm entry lets
+# create_message skip the lookup SELECT. Entries are shared between callers
+# and must not be mutated.
+CONVERSATION_CACHE: LRUCache = LRUCache(maxsize=100_000)
+
+# Messages are partitioned by (conversation_id, day bucket). A page read
+# walks buckets from newest to oldest and stops after this many, returning
+# a short page with a cursor rather than scanning a long idle stretch.
+MAX_BUCKETS_PER_PAGE = 30
+
+_EPOCH = datetime(1970, 1, 1)
+_BUCKET_POSITION = struct.Struct(">i")
+# (created_at in epoch milliseconds, message_id bytes) of the last message served
+_KEYSET_POSITION = struct.Struct(">q16s")
+
+class InvalidPagingStateError(ValueError):
+    """Raised when a paging state passed back by a client can't be resumed."""
+
+class ConversationNotFoundError(LookupError):
+    """Raised when an ID can't belong to any conversation."""
+
+def utc_now() -> datetime:
+    """The current time as a naive UTC datetime, as stored and bucketed here."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def write_timestamp(ts: datetime) -> int:
+    """Cassandra write timestamp (microseconds since the Unix epoch) for a naive UTC datetime."""
+    return (ts - _EPOCH) // timedelta(microseconds=1)
+
+def day_bucket(ts: datetime) -> int:
+    """Day bucket (days since the Unix epoch, UTC) a timestamp falls in."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return (ts - _EPOCH).days
 
 class MessageModel:
     """
@@ -28,58 +142,44 @@ class MessageModel:
         # First, get or create conversation
         conversation_data = await ConversationModel.create_or_get_conversation(sender_id, receiver_id)
         conversation_id = conversation_data['conversation_id']
-
-        # Generate a message ID (using a timestamp-based approach for simplicity)
-        message_id = int(datetime.now().timestamp() * 1000)
-        created_at = datetime.now()
-
-        # Insert the message into messages_by_conversation with named parameters
-        cassandra_client.execute(
-            """
-            INSERT INTO messages_by_conversation (
-                conversation_id, created_at, message_id, sender_id, receiver_id, content
-            ) VALUES (%(conversation_id)s, %(created_at)s, %(message_id)s, %(sender_id)s, %(receiver_id)s, %(content)s)
-            """,
-            {
-                'conversation_id': conversation_id,
-                'created_at': created_at,
-                'message_id': message_id,
-                'sender_id': sender_id,
-                'receiver_id': receiver_id,
-                'content': content
-            }
+        user1_id, user2_id = conversation_data['user1_id'], conversation_data['user2_id']
+
+        # TimeUUIDs sort by time like the clustering order, but unlike a
+        # millisecond timestamp two messages sent in the same millisecond
+        # get distinct IDs. The ID is derived from the same clock read as
+        # created_at.
+        created_at = utc_now()
+        message_id = uuid_from_time(created_at)
+
+        # The writes are independent and each targets a different partition,
+        # so issue them concurrently: the message (in its day bucket), the
+        # metadata update, and conversations_latest_by_user for both users
+        # (upserted in place; the conversations_by_user view reorders them by
+        # activity). Messages go through the coalescer, which batches bursts
+        # sent to the same conversation into one write.
+        bucket = day_bucket(created_at)
+        written_at = write_timestamp(created_at)
+        await asyncio.gather(
+            write_coalescer.write(
+                (conversation_id, bucket),
+                INSERT_MSG_CQL,
+                (conversation_id, bucket, created_at, message_id, sender_id, receiver_id, content)
+            ),
+            cassandra_client.execute_future(
+                UPDATE_META_CQL, (written_at, created_at, content, user1_id, user2_id, conversation_id)
+            ),
+            cassandra_client.execute_future(
+                UPSERT_CONV_LATEST_CQL,
+                (written_at, created_at, receiver_id, content, user1_id, user2_id, sender_id, conversation_id)
+            ),
+            cassandra_client.execute_future(
+                UPSERT_CONV_LATEST_CQL,
+                (written_at, created_at, sender_id, content, user1_id, user2_id, receiver_id, conversation_id)
+            )
         )
 
-        # Update conversation metadata
-        cassandra_client.execute(
-            """
-            UPDATE conversation_metadata 
-            SET last_message_at = %(last_message_at)s, last_message_content = %(last_message_content)s
-            WHERE conversation_id = %(conversation_id)s
-            """,
-            {
-                'last_message_at': created_at,
-                'last_message_content': content,
-                'conversation_id': conversation_id
-            }
-        )
-
-        # Update conversations_by_user for both users
-        for user_id, other_id in [(sender_id, receiver_id), (receiver_id, sender_id)]:
-            cassandra_client.execute(
-                """
-                INSERT INTO conversations_by_user (
-                    user_id, last_message_at, conversation_id, other_user_id, last_message_content
-                ) VALUES (%(user_id)s, %(last_message_at)s, %(conversation_id)s, %(other_user_id)s, %(last_message_content)s)
-                """,
-                {
-                    'user_id': user_id,
-                    'last_message_at': created_at,
-                    'conversation_id': conversation_id,
-                    'other_user_id': other_id,
-                    'last_message_content': content
-                }
-            )
+        # The cached conversation now has a stale last message
+        await redis_client.delete(conversation_key(conversation_id))
 
         # Return the created message data
         return {
@@ -92,59 +192,47 @@ class MessageModel:
         }
 
     @staticmethod
-    async def get_conversation_messages(conversation_id: int, page: int = 1, limit: int = 20) -> Dict[str, Any]:
+    async def get_conversation_messages(
+        conversation_id: uuid.UUID,
+        paging_state: Optional[bytes] = None,
+        limit: int = 20
+    ) -> Dict[str, Any]:
         """
         Get messages for a conversation with pagination.
 
         Args:
             conversation_id: ID of the conversation
-            page: Page number
+            paging_state: Paging state of the page to fetch (None for the first page)
             limit: Number of messages per page
 
         Returns:
-            Dictionary containing total, page, limit, and messages data
+            Dictionary containing limit, paging_state of the next page, and messages data
+
+        Raises:
+            ConversationNotFoundError: If conversation_id is not a TimeUUID
+            InvalidPagingStateError: If paging_state is malformed
         """
-        # Get the total count (Note: This is expensive in Cassandra, in production you'd handle this differently)
-        count_result = cassandra_client.execute(
-            "SELECT COUNT(*) as count FROM messages_by_conversation WHERE conversation_id = %(conversation_id)s",
-            {'conversation_id': conversation_id}
+        MessageModel._check_conversation_id(conversation_id)
+        if paging_state:
+            bucket, bucket_paging_state = MessageModel._unpack_position(paging_state)
+        else:
+            bucket, bucket_paging_state = await MessageModel._newest_bucket(conversation_id), None
+
+        messages, next_paging_state = await MessageModel._read_buckets(
+            SELECT_MSGS_CQL, conversation_id, (), bucket, bucket_paging_state, limit
         )
-        total = count_result[0]['count'] if count_result else 0
-
-        # Calculate the offset
-        offset = (page - 1) * limit
-
-        # Fetch messages with pagination
-        # Note: Cassandra doesn't support OFFSET directly, so we'd need to use token-based pagination
-        # For simplicity, we'll just limit the number of results, but this isn't efficient for deep pagination
-        result = cassandra_client.execute(
-            """
-            SELECT conversation_id, created_at, message_id, sender_id, receiver_id, content
-            FROM messages_by_conversation
-            WHERE conversation_id = %(conversation_id)s
-            LIMIT %(limit)s
-            """,
-            {
-                'conversation_id': conversation_id,
-                'limit': limit + offset
-            }
-        )
-
-        # Apply the offset manually
-        messages = result[offset:offset+limit] if len(result) > offset else []
 
         return {
-            'total': total,
-            'page': page,
             'limit': limit,
+            'paging_state': next_paging_state,
             'data': [
                 {
-                    'id': message['message_id'],
-                    'sender_id': message['sender_id'],
-                    'receiver_id': message['receiver_id'],
-                    'content': message['content'],
-                    'created_at': message['created_at'],
-                    'conversation_id': message['conversation_id']
+                    'id': message.message_id,
+                    'sender_id': message.sender_id,
+                    'receiver_id': message.receiver_id,
+                    'content': message.content,
+                    'created_at': message.created_at,
+                    'conversation_id': message.conversation_id
                 }
                 for message in messages
             ]
@@ -152,9 +240,9 @@ class MessageModel:
 
     @staticmethod
     async def get_messages_before_timestamp(
-        conversation_id: int,
+        conversation_id: uuid.UUID,
         before_timestamp: datetime,
-        page: int = 1,
+        paging_state: Optional[bytes] = None,
         limit: int = 20
     ) -> Dict[str, Any]:
         """
@@ -163,64 +251,199 @@ class MessageModel:
         Args:
             conversation_id: ID of the conversation
             before_timestamp: Get messages before this timestamp
-            page: Page number
+            paging_state: Paging state of the page to fetch (None for the first page)
             limit: Number of messages per page
 
         Returns:
-            Dictionary containing total, page, limit, and messages data
+            Dictionary containing limit, paging_state of the next page, and messages data
+
+        Raises:
+            ConversationNotFoundError: If conversation_id is not a TimeUUID
+            InvalidPagingStateError: If paging_state is malformed
         """
-        # Count total messages before timestamp
-        count_result = cassandra_client.execute(
-            """
-            SELECT COUNT(*) as count 
-            FROM messages_by_conversation 
-            WHERE conversation_id = %(conversation_id)s AND created_at < %(created_at)s
-            """,
-            {
-                'conversation_id': conversation_id,
-                'created_at': before_timestamp
-            }
+        MessageModel._check_conversation_id(conversation_id)
+
+        # Keyset pagination: each page continues strictly below the
+        # (created_at, message_id) of the last message served, so a page costs
+        # the same however deep it is. The smallest TimeUUID for
+        # before_timestamp makes the first page exclude that instant itself.
+        if paging_state:
+            before_timestamp, before_id = MessageModel._unpack_keyset(paging_state)
+            bucket = day_bucket(before_timestamp)
+        else:
+            before_id = min_uuid_from_time(before_timestamp)
+            # Start at the bucket of before_timestamp, unless the conversation
+            # has been idle since then
+            bucket = await MessageModel._newest_bucket(conversation_id)
+            if bucket is not None:
+                bucket = min(bucket, day_bucket(before_timestamp))
+
+        messages, next_paging_state = await MessageModel._read_buckets_before(
+            conversation_id, before_timestamp, before_id, bucket, limit
         )
-        total = count_result[0]['count'] if count_result else 0
-
-        # Calculate the offset
-        offset = (page - 1) * limit
-
-        # Fetch messages before timestamp with pagination
-        result = cassandra_client.execute(
-            """
-            SELECT conversation_id, created_at, message_id, sender_id, receiver_id, content
-            FROM messages_by_conversation
-            WHERE conversation_id = %(conversation_id)s AND created_at < %(created_at)s
-            LIMIT %(limit)s
-            """,
-            {
-                'conversation_id': conversation_id,
-                'created_at': before_timestamp,
-                'limit': limit + offset
-            }
-        )
-
-        # Apply the offset manually
-        messages = result[offset:offset+limit] if len(result) > offset else []
 
         return {
-            'total': total,
-            'page': page,
             'limit': limit,
+            'paging_state': next_paging_state,
             'data': [
                 {
-                    'id': message['message_id'],
-                    'sender_id': message['sender_id'],
-                    'receiver_id': message['receiver_id'],
-                    'content': message['content'],
-                    'created_at': message['created_at'],
-                    'conversation_id': message['conversation_id']
+                    'id': message.message_id,
+                    'sender_id': message.sender_id,
+                    'receiver_id': message.receiver_id,
+                    'content': message.content,
+                    'created_at': message.created_at,
+                    'conversation_id': message.conversation_id
                 }
                 for message in messages
             ]
         }
 
+    @staticmethod
+    def _check_conversation_id(conversation_id: uuid.UUID) -> None:
+        """Reject IDs that aren't TimeUUIDs, whose timestamp would be meaningless."""
+        if conversation_id.version != 1:
+            raise ConversationNotFoundError(f"Conversation with ID {conversation_id} not found")
+
+    @staticmethod
+    async def _newest_bucket(conversation_id: uuid.UUID) -> Optional[int]:
+        """Bucket of the conversation's latest message, or None if it doesn't exist."""
+        result = await cassandra_client.execute_future(SELECT_LAST_MESSAGE_AT_CQL, (conversation_id,))
+        if not result or result[0].last_message_at is None:
+            return None
+        return day_bucket(result[0].last_message_at)
+
+    @staticmethod
+    async def _read_buckets(
+        query: str,
+        conversation_id: uuid.UUID,
+        params: Sequence[Any],
+        bucket: Optional[int],
+        paging_state: Optional[bytes],
+        limit: int
+    ) -> Tuple[List[tuple], Optional[bytes]]:
+        """
+        Read one page of messages, walking day buckets from newest to oldest.
+
+        Args:
+            query: Message query bound with (conversation_id, bucket, *params)
+            conversation_id: ID of the conversation
+            params: Query parameters following the bucket
+            bucket: Bucket to start reading from (None for an unknown conversation)
+            paging_state: Driver paging state within `bucket`, if resuming mid-bucket
+            limit: Number of messages per page
+
+        Returns:
+            Tuple of the page rows and the position of the next page
+            (None when there are no further pages)
+        """
+        if bucket is None:
+            return [], None
+
+        # The conversation ID is a TimeUUID, so the oldest bucket that can
+        # hold its messages is known without a query
+        first_bucket = day_bucket(datetime_from_uuid1(conversation_id))
+        messages: List[tuple] = []
+        buckets_read = 0
+
+        while bucket >= first_bucket and len(messages) < limit and buckets_read < MAX_BUCKETS_PER_PAGE:
+            rows, paging_state = await cassandra_client.execute_paged(
+                query,
+                (conversation_id, bucket, *params),
+                fetch_size=limit - len(messages),
+                paging_state=paging_state
+            )
+            messages.extend(rows)
+            buckets_read += 1
+            if paging_state is None:
+                bucket -= 1
+
+        if bucket < first_bucket:
+            return messages, None
+        return messages, MessageModel._pack_position(bucket, paging_state)
+
+    @staticmethod
+    async def _read_buckets_before(
+        conversation_id: uuid.UUID,
+        before_timestamp: datetime,
+        before_id: uuid.UUID,
+        bucket: Optional[int],
+        limit: int
+    ) -> Tuple[List[tuple], Optional[bytes]]:
+        """
+        Read one page of messages older than a keyset position, walking day buckets.
+
+        One row beyond the page is fetched, so a next position is only
+        returned when another message is known to exist (or the bucket scan
+        budget ran out first).
+
+        Args:
+            conversation_id: ID of the conversation
+            before_timestamp: Messages must sort below (before_timestamp, before_id)
+            before_id: TimeUUID completing the keyset position
+            bucket: Bucket to start reading from (None for an unknown conversation)
+            limit: Number of messages per page
+
+        Returns:
+            Tuple of the page rows and the keyset position of the next page
+            (None when there are no further pages)
+        """
+        if bucket is None:
+            return [], None
+
+        first_bucket = day_bucket(datetime_from_uuid1(conversation_id))
+        messages: List[tuple] = []
+        buckets_read = 0
+
+        while bucket >= first_bucket and len(messages) <= limit and buckets_read < MAX_BUCKETS_PER_PAGE:
+            wanted = limit + 1 - len(messages)
+            rows, _ = await cassandra_client.execute_paged(
+                SELECT_MSGS_BEFORE_CQL,
+                (conversation_id, bucket, before_timestamp, before_id, wanted),
+                fetch_size=wanted
+            )
+            messages.extend(rows)
+            buckets_read += 1
+            bucket -= 1
+
+        if len(messages) > limit:
+            last = messages[limit - 1]
+            return messages[:limit], MessageModel._pack_keyset(last.created_at, last.message_id)
+        if bucket < first_bucket:
+            return messages, None
+        # Out of scan budget: continue below the oldest bucket read
+        boundary = _EPOCH + timedelta(days=bucket + 1)
+        return messages, MessageModel._pack_keyset(boundary, min_uuid_from_time(boundary))
+
+    @staticmethod
+    def _pack_keyset(created_at: datetime, message_id: uuid.UUID) -> bytes:
+        """Encode a (created_at, message_id) keyset position as a paging state."""
+        millis = (created_at - _EPOCH) // timedelta(milliseconds=1)
+        return _KEYSET_POSITION.pack(millis, message_id.bytes)
+
+    @staticmethod
+    def _unpack_keyset(position: bytes) -> Tuple[datetime, uuid.UUID]:
+        """Split a paging state built by _pack_keyset back into its parts."""
+        if len(position) != _KEYSET_POSITION.size:
+            raise InvalidPagingStateError("Paging state has the wrong length")
+        millis, message_id = _KEYSET_POSITION.unpack(position)
+        try:
+            return _EPOCH + timedelta(milliseconds=millis), uuid.UUID(bytes=message_id)
+        except OverflowError:
+            raise InvalidPagingStateError("Paging state timestamp is out of range")
+
+    @staticmethod
+    def _pack_position(bucket: int, paging_state: Optional[bytes]) -> bytes:
+        """Encode a bucket and the driver paging state within it as one paging state."""
+        return _BUCKET_POSITION.pack(bucket) + (paging_state or b"")
+
+    @staticmethod
+    def _unpack_position(position: bytes) -> Tuple[int, Optional[bytes]]:
+        """Split a paging state built by _pack_position back into its parts."""
+        if len(position) < _BUCKET_POSITION.size:
+            raise InvalidPagingStateError("Paging state is too short")
+        (bucket,) = _BUCKET_POSITION.unpack_from(position)
+        return bucket, position[_BUCKET_POSITION.size:] or None
+
 
 class ConversationModel:
     """
@@ -228,72 +451,58 @@ class ConversationModel:
     """
 
     @staticmethod
-    async def get_user_conversations(user_id: int, page: int = 1, limit: int = 20) -> Dict[str, Any]:
+    async def get_user_conversations(
+        user_id: int,
+        paging_state: Optional[bytes] = None,
+        limit: int = 20
+    ) -> Dict[str, Any]:
         """
         Get conversations for a user with pagination.
 
         Args:
             user_id: ID of the user
-            page: Page number
+            paging_state: Paging state of the page to fetch (None for the first page)
             limit: Number of conversations per page
 
         Returns:
-            Dictionary containing total, page, limit, and conversations data
-        """
-        # Count total conversations
-        count_result = cassandra_client.execute(
-            "SELECT COUNT(*) as count FROM conversations_by_user WHERE user_id = %(user_id)s",
-            {'user_id': user_id}
-        )
-        total = count_result[0]['count'] if count_result else 0
-
-        # Calculate the offset
-        offset = (page - 1) * limit
-
-        # Fetch conversations with pagination
-        result = cassandra_client.execute(
-            """
-            SELECT user_id, last_message_at, conversation_id, other_user_id, last_message_content
-            FROM conversations_by_user
-            WHERE user_id = %(user_id)s
-            LIMIT %(limit)s
-            """,
-            {
-                'user_id': user_id,
-                'limit': limit + offset
-            }
-        )
-
-        # Apply the offset manually
-        conversations = result[offset:offset+limit] if len(result) > offset else []
+            Dictionary containing limit, paging_state of the next page, and conversations data
 
-        # For each conversation, get the full metadata
-        conversation_data = []
-        for conv in conversations:
-            metadata = cassandra_client.execute(
-                "SELECT * FROM conversation_metadata WHERE conversation_id = %(conversation_id)s",
-                {'conversation_id': conv['conversation_id']}
+        Raises:
+            InvalidPagingStateError: If Cassandra rejects paging_state
+        """
+        # Fetch conversations with pagination. The paging state is passed to
+        # Cassandra as-is, so a malformed one only surfaces as a server error.
+        try:
+            conversations, next_paging_state = await cassandra_client.execute_paged(
+                SELECT_CONVS_BY_USER_CQL,
+                (user_id,),
+                fetch_size=limit,
+                paging_state=paging_state
             )
+        except (InvalidRequest, ProtocolException) as e:
+            if paging_state is None:
+                raise
+            raise InvalidPagingStateError(str(e)) from e
 
-            if metadata:
-                meta = metadata[0]
-                conversation_data.append({
-                    'id': conv['conversation_id'],
-                    'user1_id': meta['user1_id'],
-                    'user2_id': meta['user2_id'],
-                    'last_message_at': conv['last_message_at'],
-                    'last_message_content': conv['last_message_content']
-                })
-
+        # Participants are denormalized into the conversations_by_user view,
+        # so the page is answered without a conversation_metadata lookup per row
         return {
-            'total': total,
-            'page': page,
             'limit': limit,
-            'data': conversation_data
+            'paging_state': next_paging_state,
+            'data': [
+                {
+                    'id': conv.conversation_id,
+                    'user1_id': conv.user1_id,
+                    'user2_id': conv.user2_id,
+                    'last_message_at': conv.last_message_at,
+                    'last_message_content': conv.last_message_content
+                }
+                for conv in conversations
+            ]
         }
 
     @staticmethod
-    async def get_conversation(conversation_id: int) -> Dict[str, Any]:
+    async def get_conversation(conversation_id: uuid.UUID) -> Dict[str, Any]:
         """
         Get a conversation by ID.
 
@@ -303,21 +512,18 @@ class ConversationModel:
         Returns:
             Conversation data
         """
-        result = cassandra_client.execute(
-            "SELECT * FROM conversation_metadata WHERE conversation_id = %(conversation_id)s",
-            {'conversation_id': conversation_id}
-        )
+        result = await cassandra_client.execute_future(SELECT_META_CQL, (conversation_id,))
 
         if not result:
             return None
 
         conversation = result[0]
         return {
-            'id': conversation['conversation_id'],
-            'user1_id': conversation['user1_id'],
-            'user2_id': conversation['user2_id'],
-            'last_message_at': conversation['last_message_at'],
-            'last_message_content': conversation['last_message_content']
+            'id': conversation.conversation_id,
+            'user1_id': conversation.user1_id,
+            'user2_id': conversation.user2_id,
+            'last_message_at': conversation.last_message_at,
+            'last_message_content': conversation.last_message_content
         }
 
     @staticmethod
@@ -330,64 +536,49 @@ class ConversationModel:
             user2_id: ID of the second user
 
         Returns:
-            Conversation data
+            Dictionary containing conversation_id and the sorted user1_id and user2_id
         """
-        sorted_user_ids = sorted([user1_id, user2_id])
-        user1_id, user2_id = sorted_user_ids[0], sorted_user_ids[1]
+        user1_id, user2_id = min(user1_id, user2_id), max(user1_id, user2_id)
+        cache_key = (user1_id, user2_id)
 
-        result = cassandra_client.execute(
-            "SELECT * FROM user_conversations_lookup WHERE user1_id = %(user1_id)s AND user2_id = %(user2_id)s",
-            {'user1_id': user1_id, 'user2_id': user2_id}
-        )
-
-        if result:
-            conversation_id = result[0]['conversation_id']
-            conversation_data = await ConversationModel.get_conversation(conversation_id)
-            
-            return {
-                'conversation_id': conversation_data['id'],
-                'user1_id': conversation_data['user1_id'],
-                'user2_id': conversation_data['user2_id'],
-                'last_message_at': conversation_data['last_message_at'],
-                'last_message_content': conversation_data['last_message_content']
-            }
+        cached = CONVERSATION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-        conversation_id = int(datetime.now().timestamp() * 1000)
-        created_at = datetime.now()
-
-        cassandra_client.execute(
-            """
-            INSERT INTO conversation_metadata (
-                conversation_id, user1_id, user2_id, created_at, last_message_at, last_message_content
-            ) VALUES (%(conversation_id)s, %(user1_id)s, %(user2_id)s, %(created_at)s, %(last_message_at)s, %(last_message_content)s)
-            """,
-            {
-                'conversation_id': conversation_id,
-                'user1_id': user1_id,
-                'user2_id': user2_id,
-                'created_at': created_at,
-                'last_message_at': created_at,
-                'last_message_content': None
-            }
-        )
+        result = await cassandra_client.execute_future(LOOKUP_CQL, (user1_id, user2_id))
 
-        cassandra_client.execute(
-            """
-            INSERT INTO user_conversations_lookup (
-                user1_id, user2_id, conversation_id
-            ) VALUES (%(user1_id)s, %(user2_id)s, %(conversation_id)s)
-            """,
-            {
+        if result:
+            # The participants are the lookup key itself, so no metadata read is needed
+            CONVERSATION_CACHE[cache_key] = {
+                'conversation_id': result[0].conversation_id,
                 'user1_id': user1_id,
-                'user2_id': user2_id,
-                'conversation_id': conversation_id
+                'user2_id': user2_id
             }
+            return CONVERSATION_CACHE[cache_key]
+
+        created_at = utc_now()
+        conversation_id = uuid_from_time(created_at)
+
+        # Concurrent first messages between the same pair race to create the
+        # conversation. The lookup entry is claimed with a lightweight
+        # transaction, so every caller settles on the conversation_id that won,
+        # and only the winner writes the metadata row. If that write fails the
+        # lookup points at a conversation without participants; the
+        # participants are rewritten with every message, which repairs it.
+        claim = await cassandra_client.execute_future(
+            INSERT_LOOKUP_CQL, (user1_id, user2_id, conversation_id)
         )
+        if claim[0].applied:
+            await cassandra_client.execute_future(
+                INSERT_META_CQL,
+                (conversation_id, user1_id, user2_id, created_at, created_at, None, write_timestamp(created_at))
+            )
+        else:
+            conversation_id = claim[0].conversation_id
 
-        return {
+        CONVERSATION_CACHE[cache_key] = {
             'conversation_id': conversation_id,
             'user1_id': user1_id,
-            'user2_id': user2_id,
-            'last_message_at': created_at,
-            'last_message_content': None
-        }
\ No newline at end of file
+            'user2_id': user2_id
+        }
+        return CONVERSATION_CACHE[cache_key]
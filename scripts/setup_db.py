@@ -4,8 +4,9 @@ Script to initialize Cassandra keyspace and tables for the Messenger application
 import os
 import time
 import logging
-from cassandra.cluster import Cluster
+from cassandra.cluster import Cluster, NoHostAvailable
 from cassandra.auth import PlainTextAuthProvider
+from cassandra import InvalidRequest
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,17 +18,20 @@ CASSANDRA_KEYSPACE = os.getenv("CASSANDRA_KEYSPACE", "messenger")
 def wait_for_cassandra():
     """Wait for Cassandra to be ready before proceeding."""
     logger.info("Waiting for Cassandra to be ready...")
-    cluster = None
     
-    for _ in range(10):
+    for attempt in range(10):
+        # The driver shuts a Cluster down when its first connect fails, so
+        # each attempt needs a new one. The short connect timeout and
+        # exponential backoff keep startup fast once Cassandra is up.
+        cluster = Cluster([CASSANDRA_HOST], port=CASSANDRA_PORT, connect_timeout=2, protocol_version=4)
         try:
-            cluster = Cluster([CASSANDRA_HOST])
-            session = cluster.connect()
+            cluster.connect()
             logger.info("Cassandra is ready!")
             return cluster
-        except Exception as e:
-            logger.warning(f"Cassandra not ready yet: {str(e)}")
-            time.sleep(5)
+        except NoHostAvailable as e:
+            delay = min(0.5 * 2 ** attempt, 5)
+            logger.warning(f"Cassandra not ready yet, retrying in {delay}s: {str(e)}")
+            time.sleep(delay)
     
     logger.error("Failed to connect to Cassandra after multiple attempts.")
     raise Exception("Could not connect to Cassandra")
@@ -57,30 +61,52 @@ def create_tables(session):
 
     session.execute("""
     CREATE TABLE IF NOT EXISTS messages_by_conversation (
-        conversation_id bigint,
+        conversation_id timeuuid,
+        bucket int,
         created_at timestamp,
-        message_id bigint,
+        message_id timeuuid,
         sender_id int,
         receiver_id int,
         content text,
-        PRIMARY KEY (conversation_id, created_at, message_id)
+        PRIMARY KEY ((conversation_id, bucket), created_at, message_id)
     ) WITH CLUSTERING ORDER BY (created_at DESC, message_id DESC);
     """)
 
     session.execute("""
-    CREATE TABLE IF NOT EXISTS conversations_by_user (
+    CREATE TABLE IF NOT EXISTS conversations_latest_by_user (
         user_id int,
+        conversation_id timeuuid,
         last_message_at timestamp,
-        conversation_id bigint,
         other_user_id int,
         last_message_content text,
-        PRIMARY KEY (user_id, last_message_at, conversation_id)
-    ) WITH CLUSTERING ORDER BY (last_message_at DESC, conversation_id DESC);
+        user1_id int,
+        user2_id int,
+        PRIMARY KEY (user_id, conversation_id)
+    );
     """)
 
+    try:
+        session.execute("""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS conversations_by_user AS
+            SELECT user_id, last_message_at, conversation_id, other_user_id,
+                   last_message_content, user1_id, user2_id
+            FROM conversations_latest_by_user
+            WHERE user_id IS NOT NULL AND last_message_at IS NOT NULL AND conversation_id IS NOT NULL
+            PRIMARY KEY (user_id, last_message_at, conversation_id)
+            WITH CLUSTERING ORDER BY (last_message_at DESC, conversation_id DESC);
+        """)
+    except InvalidRequest as e:
+        logger.error(
+            "Could not create the conversations_by_user materialized view. "
+            "Materialized views are disabled by default; set "
+            "`materialized_views_enabled: true` in cassandra.yaml and restart Cassandra. "
+            f"Cassandra said: {str(e)}"
+        )
+        raise
+
     session.execute("""
     CREATE TABLE IF NOT EXISTS conversation_metadata (
-        conversation_id bigint,
+        conversation_id timeuuid,
         user1_id int,
         user2_id int,
         created_at timestamp,
@@ -94,7 +120,7 @@ def create_tables(session):
     CREATE TABLE IF NOT EXISTS user_conversations_lookup (
         user1_id int,
         user2_id int,
-        conversation_id bigint,
+        conversation_id timeuuid,
         PRIMARY KEY ((user1_id, user2_id))
     );
     """)
@@ -0,0 +1,98 @@
+"""
+Shared fixtures: an in-memory stand-in for the Cassandra client.
+"""
+from collections import defaultdict, namedtuple
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import uuid
+
+import pytest
+from cassandra.util import uuid_from_time
+
+from app.db.cassandra_client import cassandra_client
+from app.models import cassandra_models
+from app.models.cassandra_models import day_bucket
+
+MessageRow = namedtuple(
+    "MessageRow",
+    ["conversation_id", "created_at", "message_id", "sender_id", "receiver_id", "content"]
+)
+MetadataRow = namedtuple("MetadataRow", ["last_message_at"])
+
+
+def timeuuid_key(created_at: datetime, message_id: uuid.UUID) -> Tuple:
+    """Clustering sort key matching Cassandra's timeuuid order (time, then signed bytes)."""
+    signed = tuple(b - 256 if b > 127 else b for b in message_id.bytes[8:])
+    return created_at, message_id.time, signed
+
+
+class FakeCassandra:
+    """
+    Serves the message queries of cassandra_models from memory.
+
+    Only the statements the message read paths use are understood; anything
+    else fails loudly so a test never silently passes against a no-op.
+    """
+
+    def __init__(self):
+        self.partitions: Dict[Tuple[uuid.UUID, int], List[MessageRow]] = defaultdict(list)
+        self.last_message_at: Dict[uuid.UUID, datetime] = {}
+        self.buckets_read: List[int] = []
+        self.batches: List[List[Tuple[str, Sequence[Any]]]] = []
+
+    def add_message(self, conversation_id: uuid.UUID, created_at: datetime, content: str) -> MessageRow:
+        row = MessageRow(conversation_id, created_at, uuid_from_time(created_at), 1, 2, content)
+        partition = self.partitions[(conversation_id, day_bucket(created_at))]
+        partition.append(row)
+        partition.sort(key=lambda r: timeuuid_key(r.created_at, r.message_id), reverse=True)
+        latest = self.last_message_at.get(conversation_id)
+        if latest is None or created_at > latest:
+            self.last_message_at[conversation_id] = created_at
+        return row
+
+    async def execute_future(self, query: str, params: Sequence[Any] = ()) -> List[tuple]:
+        if query == cassandra_models.SELECT_LAST_MESSAGE_AT_CQL:
+            (conversation_id,) = params
+            if conversation_id not in self.last_message_at:
+                return []
+            return [MetadataRow(self.last_message_at[conversation_id])]
+        raise AssertionError(f"Unexpected query: {query}")
+
+    async def execute_paged(
+            self,
+            query: str,
+            params: Sequence[Any],
+            fetch_size: int,
+            paging_state: Optional[bytes] = None
+    ) -> Tuple[List[tuple], Optional[bytes]]:
+        assert fetch_size > 0
+        if query == cassandra_models.SELECT_MSGS_CQL:
+            conversation_id, bucket = params
+            rows = self.partitions.get((conversation_id, bucket), [])
+        elif query == cassandra_models.SELECT_MSGS_BEFORE_CQL:
+            conversation_id, bucket, before_timestamp, before_id, limit = params
+            position = timeuuid_key(before_timestamp, before_id)
+            rows = [
+                row for row in self.partitions.get((conversation_id, bucket), [])
+                if timeuuid_key(row.created_at, row.message_id) < position
+            ][:limit]
+        else:
+            raise AssertionError(f"Unexpected query: {query}")
+
+        self.buckets_read.append(bucket)
+        offset = int(paging_state) if paging_state else 0
+        end = offset + fetch_size
+        return rows[offset:end], (str(end).encode() if end < len(rows) else None)
+
+    async def execute_batch(self, statements: Sequence[Tuple[str, Sequence[Any]]], **kwargs) -> None:
+        self.batches.append(list(statements))
+
+
+@pytest.fixture
+def fake_cassandra(monkeypatch) -> FakeCassandra:
+    """Route cassandra_client's async query methods to a FakeCassandra."""
+    fake = FakeCassandra()
+    monkeypatch.setattr(cassandra_client, "execute_future", fake.execute_future)
+    monkeypatch.setattr(cassandra_client, "execute_paged", fake.execute_paged)
+    monkeypatch.setattr(cassandra_client, "execute_batch", fake.execute_batch)
+    return fake
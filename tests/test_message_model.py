@@ -0,0 +1,266 @@
+"""
+Tests for message bucketing and pagination in MessageModel.
+"""
+import asyncio
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from cassandra.util import uuid_from_time
+
+from app.db.cassandra_client import cassandra_client
+from app.models import cassandra_models
+from app.models.cassandra_models import (
+    CONVERSATION_CACHE,
+    MAX_BUCKETS_PER_PAGE,
+    ConversationModel,
+    InvalidPagingStateError,
+    MessageModel,
+    day_bucket,
+    utc_now,
+    write_timestamp,
+)
+
+START = datetime(2026, 1, 1, 12, 0)
+
+LookupRow = namedtuple("LookupRow", ["conversation_id"])
+LookupClaim = namedtuple("LookupClaim", ["applied", "user1_id", "user2_id", "conversation_id"])
+
+
+def read_all(fetch_page, limit):
+    """Follow paging states until exhausted, returning every page."""
+    pages, paging_state = [], None
+    while True:
+        result = asyncio.run(fetch_page(paging_state, limit))
+        pages.append(result)
+        paging_state = result['paging_state']
+        if paging_state is None:
+            return pages
+
+
+def contents(pages):
+    return [message['content'] for page in pages for message in page['data']]
+
+
+def test_day_bucket_counts_utc_days_since_epoch():
+    assert day_bucket(datetime(1970, 1, 1)) == 0
+    assert day_bucket(datetime(1970, 1, 1, 23, 59, 59, 999999)) == 0
+    assert day_bucket(datetime(1970, 1, 2)) == 1
+    assert day_bucket(datetime(1969, 12, 31, 23, 59)) == -1
+
+
+def test_day_bucket_converts_aware_timestamps_to_utc():
+    aware = datetime(2026, 1, 2, 1, 0, tzinfo=timezone(timedelta(hours=2)))
+    assert day_bucket(aware) == day_bucket(datetime(2026, 1, 1, 23, 0))
+
+
+def test_write_timestamp_is_epoch_microseconds():
+    assert write_timestamp(datetime(1970, 1, 1, 0, 0, 1, 5)) == 1_000_005
+
+
+def test_utc_now_is_naive_utc():
+    now = utc_now()
+    assert now.tzinfo is None
+    assert abs(now - datetime.now(timezone.utc).replace(tzinfo=None)) < timedelta(seconds=1)
+
+
+def test_position_round_trip():
+    assert MessageModel._unpack_position(MessageModel._pack_position(20000, b"state")) == (20000, b"state")
+    assert MessageModel._unpack_position(MessageModel._pack_position(20000, None)) == (20000, None)
+
+
+def test_position_rejects_truncated_state():
+    with pytest.raises(InvalidPagingStateError):
+        MessageModel._unpack_position(b"\x00\x01")
+
+
+def test_keyset_round_trip():
+    created_at = datetime(2026, 1, 1, 12, 0, 0, 123000)
+    message_id = uuid_from_time(created_at)
+    position = MessageModel._pack_keyset(created_at, message_id)
+    assert MessageModel._unpack_keyset(position) == (created_at, message_id)
+
+
+@pytest.mark.parametrize("position", [b"", b"\x00" * 23, b"\x00" * 25])
+def test_keyset_rejects_wrong_length(position):
+    with pytest.raises(InvalidPagingStateError):
+        MessageModel._unpack_keyset(position)
+
+
+def test_keyset_rejects_out_of_range_timestamp():
+    with pytest.raises(InvalidPagingStateError):
+        MessageModel._unpack_keyset(b"\x7f" * 8 + b"\x00" * 16)
+
+
+def test_messages_walk_buckets_newest_first(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    for day, count in [(0, 3), (2, 4), (3, 2)]:
+        for i in range(count):
+            fake_cassandra.add_message(conversation_id, START + timedelta(days=day, minutes=i), f"{day}-{i}")
+
+    pages = read_all(
+        lambda state, limit: MessageModel.get_conversation_messages(conversation_id, state, limit), 4
+    )
+
+    assert contents(pages) == ["3-1", "3-0", "2-3", "2-2", "2-1", "2-0", "0-2", "0-1", "0-0"]
+    assert [len(page['data']) for page in pages] == [4, 4, 1]
+
+
+def test_messages_page_ending_on_bucket_boundary_resumes_in_next_bucket(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    for i in range(2):
+        fake_cassandra.add_message(conversation_id, START + timedelta(minutes=i), f"0-{i}")
+        fake_cassandra.add_message(conversation_id, START + timedelta(days=1, minutes=i), f"1-{i}")
+
+    first = asyncio.run(MessageModel.get_conversation_messages(conversation_id, None, 2))
+
+    assert [m['content'] for m in first['data']] == ["1-1", "1-0"]
+    assert MessageModel._unpack_position(first['paging_state']) == (day_bucket(START), None)
+
+
+def test_messages_stop_at_scan_budget(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    fake_cassandra.add_message(conversation_id, START, "old")
+    fake_cassandra.add_message(conversation_id, START + timedelta(days=40), "new")
+
+    pages = read_all(
+        lambda state, limit: MessageModel.get_conversation_messages(conversation_id, state, limit), 5
+    )
+
+    # The first page gives up after MAX_BUCKETS_PER_PAGE buckets with a cursor,
+    # and the next one picks up where it stopped
+    assert len(fake_cassandra.buckets_read) == 41
+    assert [m['content'] for m in pages[0]['data']] == ["new"]
+    assert pages[0]['paging_state'] is not None
+    assert contents(pages) == ["new", "old"]
+    assert fake_cassandra.buckets_read[:MAX_BUCKETS_PER_PAGE] == list(
+        range(day_bucket(START) + 40, day_bucket(START) + 40 - MAX_BUCKETS_PER_PAGE, -1)
+    )
+
+
+def test_messages_unknown_conversation_is_empty(fake_cassandra):
+    result = asyncio.run(MessageModel.get_conversation_messages(uuid_from_time(START), None, 20))
+
+    assert result['data'] == []
+    assert result['paging_state'] is None
+    assert fake_cassandra.buckets_read == []
+
+
+def test_before_excludes_the_timestamp_itself(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    for i in range(3):
+        fake_cassandra.add_message(conversation_id, START + timedelta(minutes=i), f"m{i}")
+
+    result = asyncio.run(MessageModel.get_messages_before_timestamp(
+        conversation_id, START + timedelta(minutes=2), None, 20
+    ))
+
+    assert [m['content'] for m in result['data']] == ["m1", "m0"]
+    assert result['paging_state'] is None
+
+
+def test_before_keeps_messages_sharing_a_millisecond_across_pages(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    tied = START + timedelta(hours=1)
+    for i in range(5):
+        fake_cassandra.add_message(conversation_id, tied, f"tied-{i}")
+    fake_cassandra.add_message(conversation_id, START, "first")
+
+    pages = read_all(
+        lambda state, limit: MessageModel.get_messages_before_timestamp(
+            conversation_id, START + timedelta(days=1), state, limit
+        ),
+        2
+    )
+
+    served = contents(pages)
+    assert sorted(served) == sorted(["first"] + [f"tied-{i}" for i in range(5)])
+    assert len(served) == len(set(served))
+    assert served[-1] == "first"
+
+
+def test_before_has_no_cursor_when_last_page_is_exactly_full(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    for i in range(4):
+        fake_cassandra.add_message(conversation_id, START + timedelta(minutes=i), f"m{i}")
+
+    pages = read_all(
+        lambda state, limit: MessageModel.get_messages_before_timestamp(
+            conversation_id, START + timedelta(days=1), state, limit
+        ),
+        2
+    )
+
+    assert [len(page['data']) for page in pages] == [2, 2]
+    assert contents(pages) == ["m3", "m2", "m1", "m0"]
+
+
+def test_before_resumes_below_oldest_bucket_after_scan_budget(fake_cassandra):
+    conversation_id = uuid_from_time(START)
+    fake_cassandra.add_message(conversation_id, START, "old")
+    fake_cassandra.add_message(conversation_id, START + timedelta(days=40), "new")
+
+    pages = read_all(
+        lambda state, limit: MessageModel.get_messages_before_timestamp(
+            conversation_id, START + timedelta(days=50), state, limit
+        ),
+        5
+    )
+
+    assert [m['content'] for m in pages[0]['data']] == ["new"]
+    assert contents(pages) == ["new", "old"]
+    boundary, _ = MessageModel._unpack_keyset(pages[0]['paging_state'])
+    assert day_bucket(boundary) == day_bucket(START) + 40 - MAX_BUCKETS_PER_PAGE + 1
+    assert boundary.time() == datetime.min.time()
+
+
+@pytest.fixture
+def lookup_store(monkeypatch):
+    """Serve user_conversations_lookup from a dict, recording metadata inserts."""
+    store = {"lookup": {}, "metadata": []}
+
+    async def execute_future(query, params=()):
+        if query == cassandra_models.LOOKUP_CQL:
+            existing = store["lookup"].get(tuple(params))
+            return [LookupRow(existing)] if existing else []
+        if query == cassandra_models.INSERT_LOOKUP_CQL:
+            user1_id, user2_id, conversation_id = params
+            existing = store["lookup"].setdefault((user1_id, user2_id), conversation_id)
+            return [LookupClaim(existing == conversation_id, user1_id, user2_id, existing)]
+        if query == cassandra_models.INSERT_META_CQL:
+            store["metadata"].append(params[0])
+            return []
+        raise AssertionError(f"Unexpected query: {query}")
+
+    monkeypatch.setattr(cassandra_client, "execute_future", execute_future)
+    CONVERSATION_CACHE.clear()
+    yield store
+    CONVERSATION_CACHE.clear()
+
+
+def test_new_conversation_claims_lookup_and_writes_metadata(lookup_store):
+    conversation = asyncio.run(ConversationModel.create_or_get_conversation(7, 3))
+
+    assert (conversation['user1_id'], conversation['user2_id']) == (3, 7)
+    assert lookup_store["lookup"] == {(3, 7): conversation['conversation_id']}
+    assert lookup_store["metadata"] == [conversation['conversation_id']]
+
+
+def test_losing_the_lookup_race_adopts_the_winning_conversation(lookup_store, monkeypatch):
+    winner = uuid_from_time(START)
+    real_execute_future = cassandra_client.execute_future
+
+    async def racing_execute_future(query, params=()):
+        if query == cassandra_models.INSERT_LOOKUP_CQL:
+            # Another worker claims the pair between our lookup and our insert
+            lookup_store["lookup"].setdefault((params[0], params[1]), winner)
+        return await real_execute_future(query, params)
+
+    monkeypatch.setattr(cassandra_client, "execute_future", racing_execute_future)
+
+    conversation = asyncio.run(ConversationModel.create_or_get_conversation(3, 7))
+
+    assert conversation['conversation_id'] == winner
+    assert lookup_store["metadata"] == []
+    assert CONVERSATION_CACHE[(3, 7)]['conversation_id'] == winner
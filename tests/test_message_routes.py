@@ -0,0 +1,101 @@
+"""
+Request validation tests for the message and conversation list endpoints.
+"""
+import base64
+import uuid
+from datetime import datetime
+
+import pytest
+from cassandra.protocol import ProtocolException
+from cassandra.util import uuid_from_time
+from fastapi.testclient import TestClient
+
+from app.db.cassandra_client import cassandra_client
+from app.db.redis_client import redis_client
+from app.main import app
+
+# Not used as a context manager, so the startup hook never connects to Cassandra
+client = TestClient(app)
+
+CONVERSATION_ID = uuid_from_time(datetime(2026, 1, 1, 12, 0))
+
+LIST_URLS = [
+    "/api/conversations/user/1",
+    f"/api/messages/conversation/{CONVERSATION_ID}",
+    f"/api/messages/conversation/{CONVERSATION_ID}/before?before_timestamp=2026-01-02T00:00:00",
+]
+
+
+def with_query(url, query):
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def cursor(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+@pytest.mark.parametrize("url", LIST_URLS)
+@pytest.mark.parametrize("limit", [0, -1, 101])
+def test_out_of_range_limit_is_rejected(url, limit):
+    response = client.get(with_query(url, f"limit={limit}"))
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("url", LIST_URLS)
+def test_undecodable_cursor_is_rejected(url, fake_cassandra):
+    response = client.get(with_query(url, "cursor=@@@"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_truncated_bucket_cursor_is_rejected(fake_cassandra):
+    response = client.get(with_query(LIST_URLS[1], f"cursor={cursor(b'ab')}"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.parametrize("raw", [b"short", b"\x00" * 25])
+def test_wrong_length_keyset_cursor_is_rejected(raw, fake_cassandra):
+    response = client.get(with_query(LIST_URLS[2], f"cursor={cursor(raw)}"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_paging_state_rejected_by_cassandra_is_rejected(monkeypatch):
+    async def execute_paged(query, params, fetch_size, paging_state=None):
+        raise ProtocolException(0x000A, "Invalid value for the paging state", None)
+
+    async def cache_miss(key):
+        return None
+
+    monkeypatch.setattr(cassandra_client, "execute_paged", execute_paged)
+    monkeypatch.setattr(redis_client, "get", cache_miss)
+
+    response = client.get(with_query(LIST_URLS[0], f"cursor={cursor(b'garbage')}"))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.parametrize("path", ["", "/before?before_timestamp=2026-01-02T00:00:00"])
+def test_non_timeuuid_conversation_is_not_found(path, fake_cassandra):
+    response = client.get(f"/api/messages/conversation/{uuid.uuid4()}{path}")
+
+    assert response.status_code == 404
+    assert fake_cassandra.buckets_read == []
+
+
+def test_valid_request_pages_through_fake_store(fake_cassandra):
+    fake_cassandra.add_message(CONVERSATION_ID, datetime(2026, 1, 1, 12, 5), "hello")
+
+    response = client.get(with_query(LIST_URLS[1], "limit=1"))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [message["content"] for message in body["data"]] == ["hello"]
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
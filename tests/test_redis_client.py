@@ -0,0 +1,73 @@
+"""
+Tests for RedisClient's fallback while Redis is unreachable.
+"""
+import asyncio
+
+import pytest
+from redis.exceptions import ConnectionError, ResponseError
+
+from app.db import redis_client as redis_module
+from app.db.redis_client import UNAVAILABLE_BACKOFF, redis_client
+
+
+class FlakyRedis:
+    """Stands in for redis.asyncio.Redis, failing while `error` is set."""
+
+    def __init__(self):
+        self.error = None
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return b"cached"
+
+
+@pytest.fixture
+def flaky_redis(monkeypatch):
+    now = [1000.0]
+    fake = FlakyRedis()
+    monkeypatch.setattr(redis_module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(redis_client, "client", fake)
+    monkeypatch.setattr(redis_client, "_unavailable_until", 0.0)
+    monkeypatch.setattr(redis_client, "_backoff", UNAVAILABLE_BACKOFF)
+    fake.now = now
+    return fake
+
+
+def test_connection_failure_skips_redis_until_backoff_expires(flaky_redis):
+    flaky_redis.error = ConnectionError("refused")
+
+    assert asyncio.run(redis_client.get("k")) is None
+    assert asyncio.run(redis_client.get("k")) is None
+    assert flaky_redis.calls == 1
+
+    flaky_redis.error = None
+    flaky_redis.now[0] += UNAVAILABLE_BACKOFF
+    assert asyncio.run(redis_client.get("k")) == b"cached"
+    assert flaky_redis.calls == 2
+
+
+def test_backoff_doubles_and_resets_after_success(flaky_redis):
+    flaky_redis.error = ConnectionError("refused")
+    asyncio.run(redis_client.get("k"))
+    flaky_redis.now[0] += UNAVAILABLE_BACKOFF
+    asyncio.run(redis_client.get("k"))
+
+    assert redis_client._unavailable_until == flaky_redis.now[0] + 2 * UNAVAILABLE_BACKOFF
+
+    flaky_redis.error = None
+    flaky_redis.now[0] += 2 * UNAVAILABLE_BACKOFF
+    asyncio.run(redis_client.get("k"))
+
+    assert redis_client._backoff == UNAVAILABLE_BACKOFF
+
+
+def test_command_error_does_not_back_off(flaky_redis):
+    flaky_redis.error = ResponseError("WRONGTYPE")
+
+    asyncio.run(redis_client.get("k"))
+    asyncio.run(redis_client.get("k"))
+
+    assert flaky_redis.calls == 2
@@ -0,0 +1,120 @@
+"""
+Tests for WriteCoalescer micro-batching.
+"""
+import asyncio
+
+import pytest
+
+from app.db.cassandra_client import cassandra_client
+from app.db.write_coalescer import WriteCoalescer
+
+
+def run_with_coalescer(scenario, **kwargs):
+    """Run scenario(coalescer) with a started coalescer, stopping it afterwards."""
+    async def main():
+        coalescer = WriteCoalescer(**kwargs)
+        coalescer.start()
+        try:
+            return await scenario(coalescer)
+        finally:
+            await coalescer.stop()
+    return asyncio.run(main())
+
+
+def test_writes_to_one_partition_share_a_batch(fake_cassandra):
+    async def scenario(coalescer):
+        await asyncio.gather(*(
+            coalescer.write(("conv", i % 2), "INSERT", (i,)) for i in range(6)
+        ))
+
+    run_with_coalescer(scenario)
+
+    assert sorted(len(batch) for batch in fake_cassandra.batches) == [3, 3]
+    for batch in fake_cassandra.batches:
+        assert len({params[0] % 2 for _, params in batch}) == 1
+
+
+def test_full_partition_flushes_without_waiting_for_timer(fake_cassandra):
+    async def scenario(coalescer):
+        await asyncio.wait_for(
+            asyncio.gather(*(coalescer.write("conv", "INSERT", (i,)) for i in range(3))),
+            timeout=1
+        )
+
+    run_with_coalescer(scenario, flush_interval=60, max_batch_size=3)
+
+    assert [len(batch) for batch in fake_cassandra.batches] == [3]
+
+
+def test_batch_failure_fails_its_writers(fake_cassandra, monkeypatch):
+    async def failing_batch(statements, **kwargs):
+        raise RuntimeError("write timeout")
+    monkeypatch.setattr(cassandra_client, "execute_batch", failing_batch)
+
+    async def scenario(coalescer):
+        return await asyncio.gather(
+            coalescer.write("conv", "INSERT", (1,)),
+            coalescer.write("conv", "INSERT", (2,)),
+            return_exceptions=True
+        )
+
+    results = run_with_coalescer(scenario)
+
+    assert [str(result) for result in results] == ["write timeout", "write timeout"]
+
+
+def test_slow_partition_does_not_hold_up_others(fake_cassandra, monkeypatch):
+    release = None
+
+    async def batch(statements, **kwargs):
+        if statements[0][1] == ("slow",):
+            await release.wait()
+
+    monkeypatch.setattr(cassandra_client, "execute_batch", batch)
+
+    async def scenario(coalescer):
+        nonlocal release
+        release = asyncio.Event()
+        slow = asyncio.create_task(coalescer.write("slow", "INSERT", ("slow",)))
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(coalescer.write("fast", "INSERT", ("fast",)), timeout=0.5)
+        assert not slow.done()
+        release.set()
+        await slow
+
+    run_with_coalescer(scenario)
+
+
+def test_stop_drains_buffered_and_in_flight_writes(fake_cassandra, monkeypatch):
+    async def slow_batch(statements, **kwargs):
+        await asyncio.sleep(0.05)
+        fake_cassandra.batches.append(list(statements))
+
+    monkeypatch.setattr(cassandra_client, "execute_batch", slow_batch)
+
+    async def main():
+        coalescer = WriteCoalescer(flush_interval=0.01)
+        coalescer.start()
+        in_flight = asyncio.create_task(coalescer.write("a", "INSERT", (1,)))
+        await asyncio.sleep(0.02)
+        buffered = asyncio.create_task(coalescer.write("b", "INSERT", (2,)))
+        await asyncio.sleep(0)
+        await coalescer.stop()
+        return in_flight.done(), buffered.done()
+
+    assert asyncio.run(main()) == (True, True)
+    assert len(fake_cassandra.batches) == 2
+
+
+def test_write_without_flusher_executes_directly(monkeypatch):
+    executed = []
+
+    async def execute_future(query, params=()):
+        executed.append((query, params))
+        return []
+
+    monkeypatch.setattr(cassandra_client, "execute_future", execute_future)
+
+    asyncio.run(WriteCoalescer().write("conv", "INSERT", (1,)))
+
+    assert executed == [("INSERT", (1,))]